@@ -27,19 +27,27 @@ Author: Ryan Cabeen, ryan@saturnatech.com
 """
 
 import argparse
+import atexit
 import csv
+import gzip
+import hashlib
+import io
 import os
+import pickle
 import re
 import sys
 import logging
+import threading
 import time
 import mimetypes
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass, field
-from urllib.parse import urlparse, quote, unquote
+from urllib.parse import quote, unquote
 
 from notion_client import Client as NotionClient
 from notion_client.errors import APIResponseError, HTTPResponseError
@@ -79,6 +87,18 @@ def setup_logging(log_prefix: str, verbose: bool = False):
     return log_file
 
 
+def _completed_future(value) -> Future:
+    """Wrap an already-known value in a resolved Future."""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def _text_block(block_type: str, rich_text: list, **extra) -> dict:
+    """Build a Notion block whose content is rich text (plus any type-specific fields)."""
+    return {"object": "block", "type": block_type, block_type: {"rich_text": rich_text, **extra}}
+
+
 # =============================================================================
 # CLI Argument Parsing
 # =============================================================================
@@ -141,6 +161,25 @@ Examples:
         help="Enable verbose logging"
     )
 
+    parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=3,
+        help="Number of files uploaded concurrently (default: 3; requests stay paced to Notion's rate limit)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore results cached by earlier runs (parsed notes, uploaded files and link titles)"
+    )
+
+    parser.add_argument(
+        "--no-title-cache",
+        action="store_true",
+        help="Re-fetch link titles instead of reusing titles cached by earlier runs"
+    )
+
     parser.add_argument(
         "--reverse-sort",
         action="store_true",
@@ -150,6 +189,13 @@ Examples:
     return parser.parse_args()
 
 
+# Page ID (32 hex characters, with or without dashes) ending the URL path, before any ?query or #fragment
+PAGE_ID_PATTERN = re.compile(
+    r'([a-f0-9]{8}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{12})/*(?:[?#].*)?$',
+    re.IGNORECASE
+)
+
+
 def extract_page_id(notion_url: str) -> str:
     """Extract page ID from a Notion URL."""
     # Handle various Notion URL formats:
@@ -157,38 +203,24 @@ def extract_page_id(notion_url: str) -> str:
     # https://notion.so/abc123def456...
     # https://www.notion.so/abc123def456...
     # Just the ID: abc123def456...
-    
-    # Remove query params and fragments
-    url = notion_url.split('?')[0].split('#')[0]
-    
-    # Extract the last path segment
-    if '/' in url:
-        last_segment = url.rstrip('/').split('/')[-1]
-    else:
-        last_segment = url
-    
-    # The ID is the last 32 hex characters (with or without dashes)
-    uuid_pattern = r'([a-f0-9]{8}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{12})'
-    match = re.search(uuid_pattern, last_segment, re.IGNORECASE)
-    
-    if match:
-        page_id = match.group(1).replace('-', '')
-        return f"{page_id[:8]}-{page_id[8:12]}-{page_id[12:16]}-{page_id[16:20]}-{page_id[20:]}"
-    
-    # Try last 32 hex chars
-    hex_only = re.sub(r'[^a-f0-9]', '', last_segment.lower())
-    if len(hex_only) >= 32:
-        page_id = hex_only[-32:]
-        return f"{page_id[:8]}-{page_id[8:12]}-{page_id[12:16]}-{page_id[16:20]}-{page_id[20:]}"
-    
-    raise ValueError(f"Could not extract page ID from: {notion_url}")
+    match = PAGE_ID_PATTERN.search(notion_url.strip())
+    if not match:
+        raise ValueError(f"Could not extract page ID from: {notion_url}")
+
+    page_id = match.group(1).replace('-', '').lower()
+    return f"{page_id[:8]}-{page_id[8:12]}-{page_id[12:16]}-{page_id[16:20]}-{page_id[20:]}"
 
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
-@dataclass
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Config:
     """Migration configuration."""
     vault_path: Path
@@ -198,6 +230,89 @@ class Config:
     skip_files: bool = False
     verbose: bool = False
     reverse_sort: bool = False
+    use_cache: bool = True
+    use_title_cache: bool = True
+    upload_workers: int = 3
+
+
+# =============================================================================
+# Persistent Cache
+# =============================================================================
+
+# Results from earlier runs are cached here (disable with --no-cache)
+CACHE_PATH = Path.home() / ".notion_migrate_cache.pkl.gz"
+# Bump when cached objects change shape so stale caches are discarded
+CACHE_VERSION = 2
+
+
+class MigrationCache:
+    """Work saved between runs (parsed notes, uploaded files, link titles), stored as a gzipped pickle."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.notes = {}  # Note path -> (mtime_ns, size, ParsedNote)
+        self.uploads = {}  # File content key -> Notion file upload ID
+        self.titles = {}  # URL -> page title (successful fetches only)
+        self.dirty = False
+        self._load()
+        atexit.register(self.flush)
+
+    def _load(self):
+        """Load the cache from disk, starting empty if it's missing or outdated."""
+        try:
+            with gzip.open(self.path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.notes = data["notes"]
+                self.uploads = data["uploads"]
+                # Added after version 2 without a bump, so older caches keep their notes and uploads
+                self.titles = data.get("titles", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache {self.path}: {e}")
+
+    def flush(self):
+        """Write the cache back to disk if anything changed."""
+        if not self.dirty:
+            return
+        try:
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with gzip.open(tmp_path, 'wb') as f:
+                pickle.dump({"version": CACHE_VERSION, "notes": self.notes, "uploads": self.uploads,
+                             "titles": self.titles}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            logger.warning(f"Could not write cache {self.path}: {e}")
+
+
+# =============================================================================
+# Rate Limiting
+# =============================================================================
+
+class RateLimiter:
+    """Token bucket shared by all Notion API calls (Notion allows ~3 requests/second)."""
+
+    def __init__(self, rate: float = 3.0, burst: int = 3):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
 
 
 # =============================================================================
@@ -212,10 +327,22 @@ class NotionFileUploader:
     AUDIO_EXTENSIONS = {'.mp3', '.wav', '.ogg', '.m4a', '.flac'}
     PDF_EXTENSIONS = {'.pdf'}
 
-    def __init__(self, notion_token: str, config: Config):
+    # Transient API errors that are retried with backoff
+    RETRYABLE_STATUS = (429, 502, 503, 504)
+    MAX_RETRIES = 5
+
+    # Files over Notion's single-part limit are sent in parts of PART_SIZE bytes
+    SINGLE_PART_LIMIT = 20 * 1024 * 1024
+    PART_SIZE = 10 * 1024 * 1024
+
+    def __init__(self, notion_token: str, config: Config, max_workers: int = 3,
+                 limiter: Optional[RateLimiter] = None, cache: Optional[MigrationCache] = None):
         self.notion_token = notion_token
         self.config = config
-        self.upload_cache = {}
+        self.limiter = limiter or RateLimiter()
+        self.cache = cache  # File upload IDs from earlier runs, by content key
+        self.upload_cache = {}  # Resolved path -> Future of upload info
+        self._content_uploads = {}  # Content key -> Future of the first upload with those bytes
         self.failed_uploads = []  # Track failed uploads for reporting
         self.successful_uploads = []  # Track successful uploads for reporting
         self.api_base = "https://api.notion.com/v1"
@@ -223,45 +350,168 @@ class NotionFileUploader:
             "Authorization": f"Bearer {notion_token}",
             "Notion-Version": "2022-06-28",
         }
+        # Uploads are network-bound, so a few workers overlap the round-trips
+        # (kept small to stay near Notion's ~3 requests/second limit)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        # MIME types by extension, so uploads don't query the mimetypes database each time
+        self._mime_map = {
+            ext: mimetypes.guess_type('x' + ext)[0] or 'application/octet-stream'
+            for ext in self.IMAGE_EXTENSIONS | self.VIDEO_EXTENSIONS | self.AUDIO_EXTENSIONS | self.PDF_EXTENSIONS
+        }
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()
 
     def upload_file(self, file_path: Path, parent_page_id: str) -> Optional[dict]:
         """
         Upload a file to Notion using the file upload API.
         Returns dict with upload info or None on failure.
         """
+        return self.submit_upload(file_path, parent_page_id).result()
+
+    def submit_upload(self, file_path: Path, parent_page_id: str) -> Future:
+        """
+        Schedule a file upload on the worker pool.
+        Returns a Future resolving to the same value upload_file() would return.
+        """
         if self.config.skip_files:
-            return None
+            return _completed_future(None)
 
         if not file_path.exists():
             logger.warning(f"File not found: {file_path}")
-            return None
+            return _completed_future(None)
 
         cache_key = str(file_path.resolve())
-        if cache_key in self.upload_cache:
-            return self.upload_cache[cache_key]
+        with self._cache_lock:
+            future = self.upload_cache.get(cache_key)
+            if future is None:
+                if self.config.dry_run:
+                    logger.info(f"[DRY RUN] Would upload: {file_path.name}")
+                    future = _completed_future({
+                        "file_upload_id": f"dry-run-{file_path.name}",
+                        "type": self._get_block_type(file_path),
+                        "name": file_path.name,
+                    })
+                else:
+                    # Identical files saved under different names share one upload
+                    try:
+                        content_key = self._content_key(file_path)
+                    except OSError as e:
+                        # Unreadable here; _do_upload hits the same error and falls back
+                        logger.debug(f"Could not hash {file_path.name} for dedup: {e}")
+                        content_key = None
+                    original = self._content_uploads.get(content_key) if content_key else None
+                    if original is None:
+                        future = self._pool.submit(self._do_upload, file_path, parent_page_id, content_key)
+                        if content_key:
+                            self._content_uploads[content_key] = future
+                    else:
+                        future = self._reuse_upload(original, file_path, parent_page_id)
+                self.upload_cache[cache_key] = future
+        return future
+
+    def _content_key(self, file_path: Path) -> tuple:
+        """Identify a file by its bytes (small files by their content, larger ones by hash)."""
+        size = file_path.stat().st_size
+        with open(file_path, 'rb') as f:
+            if size < 4096:
+                return (f.read(), size)
+            digest = hashlib.blake2b(digest_size=16)
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return (digest.digest(), size)
+
+    def _reuse_upload(self, original: Future, file_path: Path, parent_page_id: str) -> Future:
+        """Resolve a duplicate file from the upload of an identical file, without re-sending it."""
+        future = Future()
+
+        def _on_done(done: Future):
+            info = done.result()
+            if info and info.get("file_upload_id"):
+                logger.info(f"Reused upload of {info['name']} for identical file: {file_path.name}")
+                future.set_result(self._record_success(file_path, parent_page_id, info["file_upload_id"]))
+            else:
+                future.set_result(self._handle_fallback(file_path, f"Upload of identical file {info['name']} failed"))
+
+        original.add_done_callback(_on_done)
+        return future
+
+    def shutdown(self):
+        """Wait for in-flight uploads and stop the worker pool."""
+        self._pool.shutdown(wait=True)
+
+    def _session(self) -> requests.Session:
+        """Get the calling worker's HTTP session (reuses connections between uploads)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        """POST to the Notion API, pacing requests and retrying transient errors."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.limiter.acquire()
+            response = self._session().post(url, **kwargs)
+            if response.status_code not in self.RETRYABLE_STATUS or attempt == self.MAX_RETRIES:
+                return response
+
+            # Honor Retry-After when Notion sends it, otherwise back off exponentially
+            try:
+                wait_time = float(response.headers.get("Retry-After", 2 ** attempt))
+            except ValueError:
+                wait_time = 2 ** attempt
+            logger.warning(f"Transient error ({response.status_code}), retrying in {wait_time}s... (attempt {attempt + 1}/{self.MAX_RETRIES})")
+            time.sleep(wait_time)
 
-        if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would upload: {file_path.name}")
-            result = {
-                "file_upload_id": f"dry-run-{file_path.name}",
-                "type": self._get_block_type(file_path),
-                "name": file_path.name,
-            }
-            self.upload_cache[cache_key] = result
-            return result
+    def _record_success(self, file_path: Path, parent_page_id: str, file_upload_id: str) -> dict:
+        """Track a file as uploaded and build its upload info."""
+        self.successful_uploads.append({
+            "file": str(file_path),
+            "name": file_path.name,
+            "file_upload_id": file_upload_id,
+            "parent_page_id": parent_page_id,
+        })
+        return {
+            "file_upload_id": file_upload_id,
+            "type": self._get_block_type(file_path),
+            "name": file_path.name,
+        }
+
+    def _is_reusable_upload(self, file_upload_id: str) -> bool:
+        """Check whether a file upload from an earlier run can still be attached."""
+        try:
+            self.limiter.acquire()
+            response = self._session().get(f"{self.api_base}/file_uploads/{file_upload_id}", headers=self.headers)
+            return response.status_code == 200 and response.json().get("status") == "uploaded"
+        except Exception:
+            return False
+
+    def _do_upload(self, file_path: Path, parent_page_id: str, content_key: tuple = None) -> dict:
+        """Upload a file on a worker thread. Returns upload info or fallback info."""
+        # A file uploaded on an earlier run is reused instead of being sent again
+        cached_id = self.cache.uploads.get(content_key) if self.cache and content_key else None
+        if cached_id and self._is_reusable_upload(cached_id):
+            logger.info(f"Reused upload from earlier run: {file_path.name}")
+            return self._record_success(file_path, parent_page_id, cached_id)
 
         try:
             # Step 1: Create file upload object
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if not mime_type:
-                mime_type = 'application/octet-stream'
+            mime_type = self._mime_type(file_path)
 
             create_payload = {
                 "filename": file_path.name,
                 "content_type": mime_type
             }
 
-            create_response = requests.post(
+            # Large files use multi-part mode so only one part is held in memory at a time
+            file_size = file_path.stat().st_size
+            number_of_parts = 1
+            if file_size > self.SINGLE_PART_LIMIT:
+                number_of_parts = -(-file_size // self.PART_SIZE)
+                create_payload["mode"] = "multi_part"
+                create_payload["number_of_parts"] = number_of_parts
+
+            create_response = self._post(
                 f"{self.api_base}/file_uploads",
                 headers={**self.headers, "Content-Type": "application/json"},
                 json=create_payload
@@ -280,36 +530,49 @@ class NotionFileUploader:
                 return self._handle_fallback(file_path, "No file upload ID returned")
 
             # Step 2: Send file content using multipart/form-data
+            # (each part is passed as bytes so a retried request can resend it)
             with open(file_path, 'rb') as f:
-                files = {'file': (file_path.name, f, mime_type)}
-                send_response = requests.post(
-                    f"{self.api_base}/file_uploads/{file_upload_id}/send",
-                    headers={
-                        "Authorization": f"Bearer {self.notion_token}",
-                        "Notion-Version": "2022-06-28",
-                    },
-                    files=files
+                for part_number in range(1, number_of_parts + 1):
+                    if number_of_parts > 1:
+                        chunk = f.read(self.PART_SIZE)
+                        data = {"part_number": str(part_number)}
+                    else:
+                        chunk = f.read()
+                        data = None
+
+                    send_response = self._post(
+                        f"{self.api_base}/file_uploads/{file_upload_id}/send",
+                        headers={
+                            "Authorization": f"Bearer {self.notion_token}",
+                            "Notion-Version": "2022-06-28",
+                        },
+                        data=data,
+                        files={'file': (file_path.name, chunk, mime_type)}
+                    )
+
+                    if send_response.status_code != 200:
+                        reason = f"API send failed ({send_response.status_code}): {send_response.text[:100]}"
+                        logger.warning(f"File upload send failed ({send_response.status_code}): {send_response.text[:200]}")
+                        return self._handle_fallback(file_path, reason)
+
+            # Step 3: Multi-part uploads must be explicitly completed
+            if number_of_parts > 1:
+                complete_response = self._post(
+                    f"{self.api_base}/file_uploads/{file_upload_id}/complete",
+                    headers={**self.headers, "Content-Type": "application/json"}
                 )
 
-            if send_response.status_code != 200:
-                reason = f"API send failed ({send_response.status_code}): {send_response.text[:100]}"
-                logger.warning(f"File upload send failed ({send_response.status_code}): {send_response.text[:200]}")
-                return self._handle_fallback(file_path, reason)
+                if complete_response.status_code != 200:
+                    reason = f"API complete failed ({complete_response.status_code}): {complete_response.text[:100]}"
+                    logger.warning(f"File upload complete failed ({complete_response.status_code}): {complete_response.text[:200]}")
+                    return self._handle_fallback(file_path, reason)
+
+            if self.cache and content_key:
+                self.cache.uploads[content_key] = file_upload_id
+                self.cache.dirty = True
 
-            result = {
-                "file_upload_id": file_upload_id,
-                "type": self._get_block_type(file_path),
-                "name": file_path.name,
-            }
-            self.upload_cache[cache_key] = result
-            self.successful_uploads.append({
-                "file": str(file_path),
-                "name": file_path.name,
-                "file_upload_id": file_upload_id,
-                "parent_page_id": parent_page_id,
-            })
             logger.info(f"Uploaded: {file_path.name}")
-            return result
+            return self._record_success(file_path, parent_page_id, file_upload_id)
 
         except Exception as e:
             logger.error(f"Failed to upload {file_path}: {e}")
@@ -331,6 +594,21 @@ class NotionFileUploader:
             "needs_manual_upload": True
         }
 
+    def _mime_type(self, file_path: Path) -> str:
+        """Get a file's MIME type, remembering the guess for extensions not mapped up front."""
+        # With several suffixes the earlier ones matter too (a.tar.gz is a tar archive), so guess
+        # from the whole name; the map only covers names with a single suffix
+        if len(file_path.suffixes) > 1:
+            return mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+
+        # Keyed on the suffix as written: mimetypes treats some suffixes differently by case
+        suffix = file_path.suffix
+        mime_type = self._mime_map.get(suffix)
+        if mime_type is None:
+            mime_type = mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+            self._mime_map[suffix] = mime_type
+        return mime_type
+
     def _get_block_type(self, file_path: Path) -> str:
         """Determine the Notion block type for a file."""
         suffix = file_path.suffix.lower()
@@ -351,7 +629,7 @@ class NotionFileUploader:
 # Markdown Parser
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParsedNote:
     """Represents a parsed markdown note."""
     title: str
@@ -361,17 +639,53 @@ class ParsedNote:
     file_references: list = field(default_factory=list)
     internal_links: list = field(default_factory=list)
 
+    def rewrite(self, replacements: dict) -> str:
+        """
+        Return content with spans replaced in a single pass.
+        replacements maps (start, end) offsets, as recorded in file_references, to new text.
+        """
+        parts = []
+        cursor = 0
+        for (start, end), replacement in sorted(replacements.items()):
+            if start < cursor:
+                continue  # Overlaps a span already replaced
+            parts.append(self.content[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(self.content[cursor:])
+        return ''.join(parts)
+
+
+def _iter_vault_files(root: Path):
+    """
+    Yield a DirEntry for every file under root, skipping hidden directories.
+    Walks with an explicit stack and scandir's cached file types, so deep
+    trees don't hit the recursion limit and entries aren't stat'ed twice.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk, don't descend into symlinked directories
+                if not entry.name.startswith('.') and not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                yield entry
+
+        # Push in reverse so directories are visited in listing order (same as os.walk)
+        stack.extend(reversed(subdirs))
+
 
 class MarkdownParser:
     """Parses markdown files."""
 
-    FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
-    WIKILINK_PATTERN = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
-    EMBED_PATTERN = re.compile(r'!\[\[([^\]]+)\]\]')
-    MD_IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
-    # Markdown links to local files: [text](path) - not starting with ! and path not a URL
-    MD_FILE_LINK_PATTERN = re.compile(r'(?<!!)\[([^\]]+)\]\(([^)]+)\)')
-
     # File extensions that indicate a local file link (not a web page)
     FILE_EXTENSIONS = {
         '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
@@ -382,21 +696,132 @@ class MarkdownParser:
         '.txt', '.csv', '.json', '.xml', '.yaml', '.yml',
         '.html', '.htm', '.ipynb',
     }
-    
-    def __init__(self, vault_path: Path):
+
+    # Below this many uncached notes, starting worker processes costs more than it saves
+    PARALLEL_PARSE_MIN_NOTES = 200
+
+    # Compiled on first parse by _ensure_patterns() so --help and empty runs skip the cost
+    FRONTMATTER_PATTERN = None
+    WIKILINK_PATTERN = None
+    FILE_REF_PATTERN = None
+    FILE_EXT_PATTERN = None
+    DATE_PATTERN = None
+
+    @classmethod
+    def _ensure_patterns(cls):
+        """Compile the parser's regular expressions the first time they're needed."""
+        if cls.FRONTMATTER_PATTERN is not None:
+            return
+
+        # Bracket and path classes also exclude the opening delimiter and newlines, so a failed
+        # match stops at the next "[" or "(" instead of rescanning the rest of the note; runs of
+        # unclosed brackets in a note would otherwise make these scans quadratic
+        cls.WIKILINK_PATTERN = re.compile(r'\[\[([^\[\]|\n]+)(?:\|([^\[\]\n]+))?\]\]')
+        # File references in one left-to-right scan, dispatched on the matching group:
+        # wiki embeds ![[file]], markdown images ![alt](path), and markdown links [text](path)
+        cls.FILE_REF_PATTERN = re.compile(
+            r'(?P<embed>!\[\[(?P<embed_ref>[^\[\]\n]+)\]\])'
+            r'|(?P<image>!\[[^\[\]\n]*\]\((?P<image_path>[^()\n]+)\))'
+            r'|(?P<link>(?<!!)\[[^\[\]\n]+\]\((?P<link_path>[^()\n]+)\))'
+        )
+        # Known extension at the end of a link target, optionally followed by ?query or #anchor
+        extensions = sorted(cls.FILE_EXTENSIONS, key=len, reverse=True)
+        cls.FILE_EXT_PATTERN = re.compile(
+            r'\.(?:' + '|'.join(re.escape(ext[1:]) for ext in extensions) + r')(?=[?#]|$)',
+            re.IGNORECASE
+        )
+        # Leading date of daily notes, plus the whitespace separating it from the title
+        cls.DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})\s*')
+        # Assigned last: it's the flag checked above
+        cls.FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+    def __init__(self, vault_path: Path, cache: Optional[MigrationCache] = None):
         self.vault_path = vault_path
         self.unresolved_references = []  # Track unresolved file references
-    
+        self._resolve_cache = {}  # (reference, note directory) -> resolved path or None
+        self._basename_index = None  # Filename -> paths in vault, built on first vault search
+        self._dir_index_cache = {}  # Directory -> {entry name: path}, listed once per directory
+        self._prepared = {}  # Path -> (note, unresolved references, signature, log messages) from parse_files()
+        self.cache = cache  # Notes parsed on earlier runs
+
     def parse_file(self, file_path: Path) -> ParsedNote:
-        """Parse a markdown file."""
-        content = file_path.read_text(encoding='utf-8')
+        """Parse a markdown file, reusing an earlier result if the file hasn't changed."""
+        prepared = self._prepared.pop(file_path, None)
+        if prepared is not None:
+            parsed, unresolved, signature, messages = prepared
+            # Workers don't log; their messages are emitted here, in migration order
+            for level, message in messages:
+                logger.log(level, message)
+            self.unresolved_references.extend(unresolved)
+            self._store_cached(file_path, parsed, unresolved, signature)
+            return parsed
+
+        cached = self._cached_note(file_path)
+        if cached is not None:
+            return cached
+
+        signature = self._file_signature(file_path)
+        unresolved_before = len(self.unresolved_references)
+        parsed = self._parse_file(file_path)
+        self._store_cached(file_path, parsed, self.unresolved_references[unresolved_before:], signature)
+        return parsed
+
+    def parse_files(self, file_paths: list):
+        """
+        Parse uncached notes up front across CPU cores; parse_file() then returns
+        these results. Small batches are left to be parsed on demand.
+        """
+        pending = [path for path in file_paths if self._cached_note(path) is None]
+        if len(pending) < self.PARALLEL_PARSE_MIN_NOTES:
+            return
+
+        logger.info(f"Parsing {len(pending)} notes in parallel...")
+        try:
+            with ProcessPoolExecutor(initializer=_init_parse_worker, initargs=(self.vault_path,)) as executor:
+                for file_path, result in zip(pending, executor.map(_parse_one, pending, chunksize=32)):
+                    if result is not None:
+                        self._prepared[file_path] = result
+        except Exception as e:
+            # Anything not prepared is parsed on demand instead
+            logger.warning(f"Parallel parsing unavailable, parsing notes one at a time: {e}")
+
+    def parsed_notes(self, file_paths: list):
+        """Yield the notes that are already parsed (prepared or cached), without consuming them."""
+        for file_path in file_paths:
+            prepared = self._prepared.get(file_path)
+            note = prepared[0] if prepared is not None else self._cached_note(file_path)
+            if note is not None:
+                yield note
+
+    def _file_signature(self, file_path: Path) -> tuple:
+        stat = file_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _cached_note(self, file_path: Path) -> Optional[ParsedNote]:
+        """Return the cached parse of a note if the file is unchanged since it was cached."""
+        if self.cache is None:
+            return None
+
+        cached = self.cache.notes.get(str(file_path))
+        if cached and cached[:2] == self._file_signature(file_path):
+            parsed = cached[2]
+            # Only reuse it if every referenced file is still where it was found
+            if all(ref[1].exists() for ref in parsed.file_references):
+                return parsed
+        return None
+
+    def _store_cached(self, file_path: Path, parsed: ParsedNote, unresolved: list, signature: tuple):
+        # Notes with unresolved references aren't cached, so missing files added later are picked up
+        if self.cache is None or unresolved:
+            return
+        self.cache.notes[str(file_path)] = (*signature, parsed)
+        self.cache.dirty = True
+
+    def _parse_file(self, file_path: Path) -> ParsedNote:
+        self._ensure_patterns()
+        content = self._read_note(file_path)
         
-        title = file_path.stem
-        date = self._extract_date_from_filename(title)
-        if date:
-            title = re.sub(r'^\d{4}-\d{2}-\d{2}\s*', '', title).strip()
-            if not title:
-                title = date.strftime("%Y-%m-%d")
+        date, title = self._split_dated_filename(file_path.stem)
         
         frontmatter = {}
         frontmatter_match = self.FRONTMATTER_PATTERN.match(content)
@@ -416,20 +841,37 @@ class MarkdownParser:
             internal_links=internal_links
         )
     
-    def _extract_date_from_filename(self, filename: str) -> Optional[datetime]:
-        match = re.match(r'^(\d{4}-\d{2}-\d{2})', filename)
+    def _read_note(self, file_path: Path) -> str:
+        """Read a note as UTF-8, falling back to latin-1 for legacy files."""
+        data = file_path.read_bytes()
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            content = data.decode('latin-1')
+        # Decoding bytes skips read_text's universal-newline translation, so do it here
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
+    def _split_dated_filename(self, filename: str) -> tuple:
+        """Split a "YYYY-MM-DD Title" filename into (date, title); date is None if there isn't one."""
+        match = self.DATE_PATTERN.match(filename)
         if match:
             try:
-                return datetime.strptime(match.group(1), "%Y-%m-%d")
+                date = datetime(int(match[1]), int(match[2]), int(match[3]))
             except ValueError:
-                pass
-        return None
+                return None, filename
+            return date, filename[match.end():].strip() or date.strftime("%Y-%m-%d")
+        return None, filename
     
     def _parse_frontmatter(self, frontmatter_text: str) -> dict:
         result = {}
-        for line in frontmatter_text.strip().split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
+        for line in frontmatter_text.split('\n'):
+            # Skip blank lines and YAML comments
+            if not line or line.startswith('#'):
+                continue
+            key, sep, value = line.partition(':')
+            if sep:
                 result[key.strip()] = value.strip()
         return result
     
@@ -437,106 +879,128 @@ class MarkdownParser:
         refs = []
         files_dir = note_dir / "files"
 
-        # Track positions we've already matched to avoid duplicates
-        matched_positions = set()
+        # Alternation never yields overlapping matches, so each reference is seen once
+        for match in self.FILE_REF_PATTERN.finditer(content):
+            kind = match.lastgroup
+
+            if kind == 'embed':
+                # Wiki-style embeds: ![[filename]]
+                path = match.group('embed_ref')
+            elif kind == 'image':
+                # Markdown images: ![alt](path)
+                path = match.group('image_path')
+                if path.startswith(('http://', 'https://', 'data:')):
+                    continue
+            else:
+                # Markdown file links: [text](path) - for local files only
+                path = match.group('link_path')
+                # Skip web URLs
+                if path.startswith(('http://', 'https://', 'data:', '#', 'mailto:')):
+                    continue
 
-        # Wiki-style embeds: ![[filename]]
-        for match in self.EMBED_PATTERN.finditer(content):
-            ref = match.group(1)
-            file_path = self._resolve_file_path(ref, note_dir, files_dir, note_path)
+                # Check if it looks like a file (has a known extension)
+                ext_match = self.FILE_EXT_PATTERN.search(path)
+                if not ext_match:
+                    continue
+                # Drop any ?query or #anchor (e.g. doc.pdf#page=3)
+                path = path[:ext_match.end()]
+
+            file_path = self._resolve_file_path(path, note_dir, files_dir, note_path)
             if file_path:
                 refs.append((match.group(0), file_path, match.start(), match.end()))
-                matched_positions.add((match.start(), match.end()))
-
-        # Markdown images: ![alt](path)
-        for match in self.MD_IMAGE_PATTERN.finditer(content):
-            path = match.group(2)
-            if not path.startswith(('http://', 'https://', 'data:')):
-                file_path = self._resolve_file_path(path, note_dir, files_dir, note_path)
-                if file_path:
-                    refs.append((match.group(0), file_path, match.start(), match.end()))
-                    matched_positions.add((match.start(), match.end()))
-
-        # Markdown file links: [text](path) - for local files only
-        for match in self.MD_FILE_LINK_PATTERN.finditer(content):
-            # Skip if this position was already matched (e.g., as an image)
-            if (match.start(), match.end()) in matched_positions:
-                continue
-
-            path = match.group(2)
-            # Skip web URLs
-            if path.startswith(('http://', 'https://', 'data:', '#', 'mailto:')):
-                continue
-
-            # Check if it looks like a file (has a known extension)
-            path_lower = path.lower()
-            has_file_ext = any(path_lower.endswith(ext) for ext in self.FILE_EXTENSIONS)
-
-            if has_file_ext:
-                file_path = self._resolve_file_path(path, note_dir, files_dir, note_path)
-                if file_path:
-                    refs.append((match.group(0), file_path, match.start(), match.end()))
 
         return refs
     
     def _resolve_file_path(self, ref: str, note_dir: Path, files_dir: Path, note_path: Path = None) -> Optional[Path]:
         ref = ref.strip()
 
+        # Resolution only depends on the reference and where the note lives,
+        # so notes sharing a directory reuse each other's lookups
+        cache_key = (ref, note_dir)
+        if cache_key in self._resolve_cache:
+            found = self._resolve_cache[cache_key]
+        else:
+            found = self._locate_file(ref, note_dir, files_dir)
+            self._resolve_cache[cache_key] = found
+
+        if found:
+            return found
+
+        logger.warning(f"Could not resolve file reference: {ref}")
+        self.unresolved_references.append({
+            "note": str(note_path) if note_path else "Unknown",
+            "reference": ref
+        })
+        return None
+
+    def _locate_file(self, ref: str, note_dir: Path, files_dir: Path) -> Optional[Path]:
+        """Find the file a reference points to, or None if it isn't in the vault."""
         # URL-decode the reference (e.g., %20 -> space)
         ref_decoded = unquote(ref)
 
         # Try both encoded and decoded versions
         for r in [ref_decoded, ref] if ref_decoded != ref else [ref]:
-            if files_dir.exists():
-                candidate = files_dir / r
-                if candidate.exists():
-                    return candidate
-                candidate = files_dir / Path(r).name
-                if candidate.exists():
-                    return candidate
-
-            candidate = note_dir / r
-            if candidate.exists():
-                return candidate
-
-            candidate = self.vault_path / r
-            if candidate.exists():
+            ref_name = Path(r).name
+            candidate = (
+                self._lookup(files_dir, r)
+                or self._lookup(files_dir, ref_name)
+                or self._lookup(note_dir, r)
+                or self._lookup(self.vault_path, r)
+            )
+            if candidate:
                 return candidate
 
-            if files_dir.exists():
-                ref_name = Path(r).name
-                for f in files_dir.iterdir():
-                    if f.name == ref_name or f.stem == Path(r).stem:
-                        return f
+            ref_stem = Path(r).stem
+            for name, f in self._dir_index(files_dir).items():
+                if name == ref_name or f.stem == ref_stem:
+                    return f
 
         # Fallback: search entire vault for file with same basename
         basename = Path(unquote(ref)).name
         found = self._search_vault_for_file(basename)
         if found:
             logger.info(f"Found '{basename}' at alternate location: {found}")
-            return found
+        return found
 
-        logger.warning(f"Could not resolve file reference: {ref}")
-        self.unresolved_references.append({
-            "note": str(note_path) if note_path else "Unknown",
-            "reference": ref
-        })
-        return None
+    def _dir_index(self, directory: Path) -> dict:
+        """List a directory once, mapping entry names to paths (empty if it doesn't exist)."""
+        index = self._dir_index_cache.get(directory)
+        if index is None:
+            try:
+                with os.scandir(directory) as it:
+                    index = {entry.name: Path(entry.path) for entry in it}
+            except OSError:
+                index = {}
+            self._dir_index_cache[directory] = index
+        return index
+
+    def _lookup(self, directory: Path, ref: str) -> Optional[Path]:
+        """Return directory / ref if it exists, using the cached listing for plain filenames."""
+        if '/' not in ref and os.sep not in ref:
+            index = self._dir_index(directory)
+            found = index.get(ref)
+            # A miss in a listed directory may still exist under another case
+            # on case-insensitive filesystems (macOS, Windows), so ask the filesystem
+            if found or not index:
+                return found
+        candidate = directory / ref
+        return candidate if candidate.exists() else None
 
     def _search_vault_for_file(self, basename: str) -> Optional[Path]:
         """Search the entire vault for a file with the given basename."""
-        # Also try URL-decoded version
-        basename_decoded = unquote(basename)
+        if self._basename_index is None:
+            self._basename_index = self._build_basename_index()
 
-        for root, dirs, files in os.walk(self.vault_path):
-            # Skip hidden directories and common non-content dirs
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-            for filename in files:
-                if filename == basename or filename == basename_decoded:
-                    return Path(root) / filename
-
-        return None
+        # Also try URL-decoded version
+        matches = self._basename_index.get(basename) or self._basename_index.get(unquote(basename))
+        return matches[0] if matches else None
+
+    def _build_basename_index(self) -> dict:
+        """Walk the vault once and map each filename to the paths where it appears."""
+        index = {}
+        for entry in _iter_vault_files(self.vault_path):
+            index.setdefault(entry.name, []).append(Path(entry.path))
+        return index
     
     def _find_internal_links(self, content: str) -> list:
         links = []
@@ -548,6 +1012,45 @@ class MarkdownParser:
         return links
 
 
+# Per-process parser for parse_files() workers, so each worker indexes the vault once
+_worker_parser = None
+_worker_logs = None
+
+
+class _CapturedLogs(logging.Handler):
+    """Collects a worker's log messages so the main process can emit them with its own handlers."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []  # (level, message)
+
+    def emit(self, record: logging.LogRecord):
+        self.messages.append((record.levelno, record.getMessage()))
+
+
+def _init_parse_worker(vault_path: Path):
+    global _worker_parser, _worker_logs
+    _worker_parser = MarkdownParser(vault_path)
+    # Spawned workers have no logging handlers (forked ones write out of order), so capture
+    # everything the parser logs and hand it back with each result instead
+    _worker_logs = _CapturedLogs()
+    logger.handlers = [_worker_logs]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+
+def _parse_one(file_path: Path) -> Optional[tuple]:
+    """Parse a note in a worker process. Returns None on failure so the note is retried on demand."""
+    _worker_logs.messages = []
+    try:
+        signature = _worker_parser._file_signature(file_path)
+        unresolved_before = len(_worker_parser.unresolved_references)
+        parsed = _worker_parser.parse_file(file_path)
+    except Exception:
+        return None
+    return parsed, _worker_parser.unresolved_references[unresolved_before:], signature, _worker_logs.messages
+
+
 # =============================================================================
 # Notion Block Builder
 # =============================================================================
@@ -557,28 +1060,57 @@ class NotionBlockBuilder:
 
     # Pattern for bare URLs (not inside markdown link syntax)
     BARE_URL_PATTERN = re.compile(r'(?<!\()(https?://[^\s<>\[\]()]+)')
-
-    def __init__(self, file_uploader: NotionFileUploader):
+    # Link text can't contain brackets and URLs can't contain "[", so an unclosed "[text](" stops at
+    # the next "[" instead of rescanning the line (URLs may still hold parentheses, e.g. Wikipedia)
+    MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\[\]\n]+)\]\(([^)\[\n]+)\)')
+    # http(s) URL whose host (everything up to the first / ? or #) contains a dot and no brackets
+    VALID_URL_PATTERN = re.compile(r'https?://(?=[^/?#]*\.)[^/?#\[\]]*(?:[/?#]|$)')
+    # Markdown links and bare URLs together, for building rich text in a single pass
+    INLINE_LINK_PATTERN = re.compile(
+        r'(?P<link>\[(?P<link_text>[^\[\]\n]+)\]\((?P<link_url>[^)\[\n]+)\))'
+        r'|(?<!\()(?P<url>https?://[^\s<>\[\]()]+)'
+    )
+    # Wikilinks with an alias [[target|alias]] and without [[target]]; like the parser's
+    # patterns, the classes exclude "[" so unclosed brackets don't make the scan quadratic
+    WIKILINK_ALIAS_PATTERN = re.compile(r'\[\[([^\[\]|\n]+)\|([^\[\]\n]+)\]\]')
+    WIKILINK_PLAIN_PATTERN = re.compile(r'\[\[([^\[\]\n]+)\]\]')
+    # Line prefix of each block type; todos are listed before bullets, which would otherwise claim them
+    LINE_PREFIX_PATTERN = re.compile(
+        r'(?P<h3>### )|(?P<h2>## )|(?P<h1># )'
+        r'|(?P<todo_done>- \[[xX]\] )|(?P<todo>- \[ \] )|(?P<bullet>[-*] )'
+        r'|(?P<numbered>\d+\. )|(?P<quote>> )'
+    )
+    DIVIDER_LINES = frozenset({'---', '***', '___'})
+    HEADING_TYPES = ("heading_1", "heading_2", "heading_3")
+    # Fence info strings mapped to Notion code block languages
+    CODE_LANGUAGES = {"js": "javascript", "ts": "typescript", "py": "python", "rb": "ruby",
+                      "yml": "yaml", "sh": "shell", "bash": "shell", "zsh": "shell", "": "plain text"}
+    # Bold, italic and inline code spans; the capture group keeps them in split() output
+    FORMATTING_PATTERN = re.compile(r'(\*\*[^*]+\*\*|__[^_]+__|(?<!\*)\*[^*]+\*(?!\*)|_[^_]+_|`[^`]+`)')
+    TITLE_TAG_PATTERN = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+    # Site name suffix of a page title, e.g. "Article - Site"
+    TITLE_SUFFIX_PATTERN = re.compile(r'\s*[|\-–—]\s*[^|\-–—]+$')
+
+    # Size of the shared page title fetch pool, and of the HTTP connection pool it draws on
+    TITLE_FETCH_WORKERS = 16
+    # Pages are read only up to </title>; this caps the read when there isn't one
+    TITLE_SCAN_LIMIT = 256 * 1024
+    # Distinct lines whose rich text is kept for reuse
+    RICH_TEXT_CACHE_SIZE = 4096
+
+    def __init__(self, file_uploader: NotionFileUploader, cache: Optional[MigrationCache] = None):
         self.file_uploader = file_uploader
         self.pending_files = []  # Files that need upload after page creation
-        self.title_cache = {}  # Cache for fetched page titles
+        self.cache = cache  # Titles fetched on earlier runs
+        self.title_cache = dict(cache.titles) if cache else {}  # Cache for fetched page titles
+        self._rich_text_cache = {}  # Line text -> rich text segments
 
-    def _is_valid_url(self, url: str) -> bool:
-        """Check if a URL is valid for Notion."""
-        try:
-            parsed = urlparse(url)
-            # Must have scheme and netloc (domain)
-            if not parsed.scheme or not parsed.netloc:
-                return False
-            # Scheme must be http or https
-            if parsed.scheme not in ('http', 'https'):
-                return False
-            # Domain must have at least one dot (basic check)
-            if '.' not in parsed.netloc:
-                return False
-            return True
-        except Exception:
-            return False
+        # Shared session so title fetches reuse connections (the adapter's pool is thread-safe)
+        self._http = requests.Session()
+        self._http.headers['User-Agent'] = 'Mozilla/5.0 (compatible; NotionMigrator/1.0)'
+        adapter = HTTPAdapter(pool_connections=self.TITLE_FETCH_WORKERS, pool_maxsize=self.TITLE_FETCH_WORKERS)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
 
     def _sanitize_url(self, url: str) -> Optional[str]:
         """Sanitize and validate a URL for Notion. Returns None if invalid."""
@@ -586,14 +1118,10 @@ class NotionBlockBuilder:
             return None
 
         # Strip whitespace and common surrounding characters
-        url = url.strip().strip('<>').strip('"\'')
+        url = url.strip().strip('<>"\'')
 
-        # Handle URLs that might have been mangled
-        if not url.startswith(('http://', 'https://')):
-            return None
-
-        # Validate
-        if not self._is_valid_url(url):
+        # Must be http(s) with a dotted domain
+        if not self.VALID_URL_PATTERN.match(url):
             logger.debug(f"Invalid URL skipped: {url}")
             return None
 
@@ -605,155 +1133,228 @@ class NotionBlockBuilder:
             return self.title_cache[url]
 
         try:
-            response = requests.get(url, timeout=5, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; NotionMigrator/1.0)'
-            })
-            if response.status_code == 200:
+            with self._http.get(url, timeout=5, stream=True) as response:
+                # Headers arrive first, so non-HTML links (images, PDFs, ...) are never downloaded
+                content_type = response.headers.get('Content-Type', 'text/html')
+                head = None
+                if response.status_code == 200 and 'html' in content_type.lower():
+                    head = self._read_html_head(response)
+            if head:
                 # Look for <title> tag
-                match = re.search(r'<title[^>]*>([^<]+)</title>', response.text, re.IGNORECASE)
+                match = self.TITLE_TAG_PATTERN.search(head)
                 if match:
                     title = match.group(1).strip()
                     # Clean up common title suffixes
-                    title = re.sub(r'\s*[|\-–—]\s*[^|\-–—]+$', '', title).strip()
+                    title = self.TITLE_SUFFIX_PATTERN.sub('', title).strip()
                     if title:
                         self.title_cache[url] = title
+                        if self.cache:
+                            self.cache.titles[url] = title
+                            self.cache.dirty = True
                         return title
         except Exception:
             pass  # Silently fail, we'll just use the URL
 
         self.title_cache[url] = None
         return None
+
+    def _read_html_head(self, response: requests.Response) -> str:
+        """Read a streamed page only up to its closing </title> tag (or TITLE_SCAN_LIMIT bytes)."""
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=8192):
+            buf += chunk
+            # Only the new chunk (plus room for a tag split across chunks) can hold the closing tag
+            if b'</title>' in buf[-len(chunk) - 7:].lower() or len(buf) >= self.TITLE_SCAN_LIMIT:
+                break
+        return buf.decode(response.encoding or 'utf-8', errors='replace')
+
+    def prefetch_titles(self, contents):
+        """Fetch titles for bare URLs in the given note contents concurrently; building blocks then hits the cache."""
+        urls = set()
+        for content in contents:
+            in_code_block = False
+            for line in content.split('\n'):
+                if line.startswith('```'):
+                    in_code_block = not in_code_block
+                    continue
+                if in_code_block or 'http' not in line:
+                    continue
+                # URLs inside [text](url) links keep their link text and aren't fetched
+                for match in self.BARE_URL_PATTERN.finditer(self.MARKDOWN_LINK_PATTERN.sub(' ', line)):
+                    url = self._sanitize_url(match.group(1).rstrip('.,;:!?)"\''))
+                    if url and url not in self.title_cache:
+                        urls.add(url)
+
+        if not urls:
+            return
+        logger.debug(f"Fetching titles for {len(urls)} links...")
+        with ThreadPoolExecutor(max_workers=min(self.TITLE_FETCH_WORKERS, len(urls))) as pool:
+            list(pool.map(self._fetch_page_title, urls))
     
     def build_blocks(self, parsed_note: ParsedNote, note_dir: Path, page_id: str = None) -> list:
         """Convert parsed note to Notion blocks."""
         blocks = []
         content = parsed_note.content
+        self.prefetch_titles([content])
         
-        # Upload files and build replacement info
+        # Start file uploads and build replacement info (resolved when the embed is reached)
         file_info_map = {}
         for original_ref, file_path, start, end in parsed_note.file_references:
             if page_id:
-                file_info = self.file_uploader.upload_file(file_path, page_id)
+                file_future = self.file_uploader.submit_upload(file_path, page_id)
             else:
-                file_info = {"name": file_path.name, "type": self.file_uploader._get_block_type(file_path), "local_path": str(file_path)}
-            file_info_map[original_ref] = (file_path, file_info)
+                file_future = _completed_future({"name": file_path.name, "type": self.file_uploader._get_block_type(file_path), "local_path": str(file_path)})
+            file_info_map[original_ref] = (file_path, file_future)
+
+        # All refs in one alternation, longest first so a ref wins over any ref it contains
+        embed_pattern = None
+        if file_info_map:
+            embed_pattern = re.compile('|'.join(map(re.escape, sorted(file_info_map, key=len, reverse=True))))
         
-        lines = content.split('\n')
-        i = 0
         in_code_block = False
         code_block_lang = ""
-        code_block_lines = []
+        code_buf = io.StringIO()
+
+        # Bound once for the per-line loop
+        append = blocks.append
+        convert_wikilinks = self._convert_wikilinks
+        paragraph_block = self._paragraph_block
+        match_prefix = self.LINE_PREFIX_PATTERN.match
+        line_handlers = self.LINE_HANDLERS
+        divider_lines = self.DIVIDER_LINES
         
-        while i < len(lines):
-            line = lines[i]
-            
+        for line in content.split('\n'):
             # Handle code blocks
             if line.startswith('```'):
                 if not in_code_block:
                     in_code_block = True
                     code_block_lang = line[3:].strip() or "plain text"
-                    code_block_lines = []
+                    code_buf = io.StringIO()
                 else:
-                    blocks.append(self._code_block('\n'.join(code_block_lines), code_block_lang))
+                    # Drop the newline written after the last line
+                    append(self._code_block(code_buf.getvalue()[:-1], code_block_lang))
                     in_code_block = False
-                i += 1
                 continue
             
             if in_code_block:
-                code_block_lines.append(line)
-                i += 1
+                code_buf.write(line)
+                code_buf.write('\n')
                 continue
             
-            # Check for file embeds
-            embed_handled = False
-            for original_ref, (file_path, file_info) in file_info_map.items():
-                if original_ref in line:
-                    embed_handled = True
-                    parts = line.split(original_ref)
-
-                    if parts[0].strip():
-                        blocks.append(self._paragraph_block(self._convert_wikilinks(parts[0].strip())))
-
-                    # Check if file was successfully uploaded (has file_upload_id)
-                    if file_info and file_info.get("file_upload_id"):
-                        file_block = self._file_block(file_info)
-                        if file_block:
-                            blocks.append(file_block)
-                        else:
-                            blocks.append(self._callout_block(
-                                f"📎 Attachment: {file_info.get('name', file_path.name)}",
-                                "gray_background"
-                            ))
-                    elif file_info:
-                        # Fallback for failed uploads
-                        blocks.append(self._callout_block(
-                            f"📎 Attachment: {file_info.get('name', file_path.name)} (upload failed)",
+            # Check for file embeds (every ref contains "[", so most lines skip the search)
+            embed = embed_pattern.search(line) if embed_pattern and '[' in line else None
+            if embed:
+                file_path, file_future = file_info_map[embed.group()]
+                file_info = file_future.result()
+                before, after = line[:embed.start()], line[embed.end():]
+
+                if before.strip():
+                    append(paragraph_block(convert_wikilinks(before.strip())))
+
+                # Check if file was successfully uploaded (has file_upload_id)
+                if file_info and file_info.get("file_upload_id"):
+                    file_block = self._file_block(file_info)
+                    if file_block:
+                        append(file_block)
+                    else:
+                        append(self._callout_block(
+                            f"📎 Attachment: {file_info.get('name', file_path.name)}",
                             "gray_background"
                         ))
-
-                    after = original_ref.join(parts[1:]).strip()
-                    if after:
-                        blocks.append(self._paragraph_block(self._convert_wikilinks(after)))
-                    break
-            
-            if embed_handled:
-                i += 1
+                elif file_info:
+                    # Fallback for failed uploads
+                    append(self._callout_block(
+                        f"📎 Attachment: {file_info.get('name', file_path.name)} (upload failed)",
+                        "gray_background"
+                    ))
+
+                after = after.strip()
+                if after:
+                    append(paragraph_block(convert_wikilinks(after)))
                 continue
             
-            # Headers
-            if line.startswith('# '):
-                blocks.append(self._heading_block(line[2:], 1))
-            elif line.startswith('## '):
-                blocks.append(self._heading_block(line[3:], 2))
-            elif line.startswith('### '):
-                blocks.append(self._heading_block(line[4:], 3))
-            elif line.startswith('- ') or line.startswith('* '):
-                blocks.append(self._bullet_block(self._convert_wikilinks(line[2:])))
-            elif re.match(r'^\d+\. ', line):
-                text = re.sub(r'^\d+\. ', '', line)
-                blocks.append(self._numbered_block(self._convert_wikilinks(text)))
-            elif line.startswith('- [ ] '):
-                blocks.append(self._todo_block(self._convert_wikilinks(line[6:]), False))
-            elif line.startswith('- [x] ') or line.startswith('- [X] '):
-                blocks.append(self._todo_block(self._convert_wikilinks(line[6:]), True))
-            elif line.startswith('> '):
-                blocks.append(self._quote_block(self._convert_wikilinks(line[2:])))
-            elif line.strip() in ['---', '***', '___']:
-                blocks.append(self._divider_block())
-            elif line.strip():
-                converted_line = self._convert_wikilinks(line)
-                blocks.append(self._paragraph_block(converted_line))
-            
-            i += 1
+            # Headers, list items and quotes, classified by their prefix
+            prefix = match_prefix(line)
+            if prefix:
+                append(line_handlers[prefix.lastgroup](self, line[prefix.end():]))
+                continue
+            stripped = line.strip()
+            if stripped in divider_lines:
+                append(self._divider_block())
+            elif stripped:
+                append(paragraph_block(convert_wikilinks(line)))
         
-        if in_code_block and code_block_lines:
-            blocks.append(self._code_block('\n'.join(code_block_lines), code_block_lang))
+        if in_code_block and code_buf.tell():
+            append(self._code_block(code_buf.getvalue()[:-1], code_block_lang))
         
         return blocks
     
+    # Block builder for each LINE_PREFIX_PATTERN group, given the text after the prefix
+    LINE_HANDLERS = {
+        'h1': lambda self, text: self._heading_block(text, 1),
+        'h2': lambda self, text: self._heading_block(text, 2),
+        'h3': lambda self, text: self._heading_block(text, 3),
+        'todo_done': lambda self, text: self._todo_block(self._convert_wikilinks(text), True),
+        'todo': lambda self, text: self._todo_block(self._convert_wikilinks(text), False),
+        'bullet': lambda self, text: self._bullet_block(self._convert_wikilinks(text)),
+        'numbered': lambda self, text: self._numbered_block(self._convert_wikilinks(text)),
+        'quote': lambda self, text: self._quote_block(self._convert_wikilinks(text)),
+    }
+
     def _convert_wikilinks(self, text: str) -> str:
-        text = re.sub(r'\[\[([^\]|]+)\|([^\]]+)\]\]', r'\2', text)
-        text = re.sub(r'\[\[([^\]]+)\]\]', r'\1', text)
-        return text
+        # Most lines have no wikilinks; skip both substitutions for them
+        if '[[' not in text:
+            return text
+        text = self.WIKILINK_ALIAS_PATTERN.sub(r'\2', text)
+        if '[[' not in text:
+            return text
+        return self.WIKILINK_PLAIN_PATTERN.sub(r'\1', text)
     
     def _rich_text(self, text: str) -> list:
+        """Rich text for a line, reused for repeated lines (the segments are never modified)."""
         if not text:
             return []
 
-        segments = []
+        segments = self._rich_text_cache.get(text)
+        if segments is None:
+            segments = self._build_rich_text(text)
+            if len(self._rich_text_cache) >= self.RICH_TEXT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._rich_text_cache[next(iter(self._rich_text_cache))]
+            self._rich_text_cache[text] = segments
+        return segments
+
+    def _build_rich_text(self, text: str) -> list:
+        """Convert a line of markdown text to Notion rich text segments."""
+        # Most text has no links or URLs; only inline formatting applies
+        if '](' not in text and 'http' not in text:
+            return self._parse_formatted_text(text) or [{"type": "text", "text": {"content": ""}}]
 
-        # Step 1: Process markdown links [text](url)
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+        segments = []
 
+        # Markdown links [text](url) and bare URLs in one left-to-right scan; the text between
+        # them is parsed for formatting once the next link (or the end of the text) is reached
         last_end = 0
-        for match in re.finditer(link_pattern, text):
-            # Add text before the link (will be processed for bare URLs)
-            if match.start() > last_end:
-                segments.extend(self._parse_text_with_urls(text[last_end:match.start()]))
+        for match in self.INLINE_LINK_PATTERN.finditer(text):
+            if match.lastgroup == 'link':
+                link_text = match.group('link_text')
+                link_url = self._sanitize_url(match.group('link_url'))
+                end = match.end()
+            else:
+                # Strip trailing punctuation from matched URL
+                raw_url = match.group('url').rstrip('.,;:!?)"\'')
+                link_url = self._sanitize_url(raw_url)
+                if not link_url:
+                    # Invalid URL - leave it in the surrounding text
+                    continue
+                # Fetch title and create link
+                link_text = self._fetch_page_title(link_url) or link_url
+                # Any stripped punctuation stays in the following text
+                end = match.start() + len(raw_url)
 
-            # Add the markdown link (validate URL first)
-            link_text = match.group(1)
-            link_url = self._sanitize_url(match.group(2))
+            # Add text before the link
+            if match.start() > last_end:
+                segments.extend(self._parse_formatted_text(text[last_end:match.start()]))
 
             if link_url:
                 segments.append({
@@ -764,64 +1365,16 @@ class NotionBlockBuilder:
                     }
                 })
             else:
-                # Invalid URL - just output the text without link
+                # Invalid markdown link URL - just output the text without link
                 segments.extend(self._parse_formatted_text(link_text))
 
-            last_end = match.end()
-
-        # Add remaining text after last markdown link
-        if last_end < len(text):
-            segments.extend(self._parse_text_with_urls(text[last_end:]))
-
-        return segments if segments else [{"type": "text", "text": {"content": ""}}]
-
-    def _parse_text_with_urls(self, text: str) -> list:
-        """Parse text for bare URLs and convert them to links with titles."""
-        if not text:
-            return []
-
-        segments = []
-        last_end = 0
-
-        for match in self.BARE_URL_PATTERN.finditer(text):
-            # Strip trailing punctuation from matched URL
-            raw_url = match.group(1).rstrip('.,;:!?)"\'')
-
-            # Validate the URL
-            url = self._sanitize_url(raw_url)
-            if not url:
-                # Invalid URL - skip this match, it will be processed as regular text
-                continue
-
-            # Add text before the URL
-            if match.start() > last_end:
-                segments.extend(self._parse_formatted_text(text[last_end:match.start()]))
-
-            # Fetch title and create link
-            title = self._fetch_page_title(url)
-            link_text = title if title else url
-
-            segments.append({
-                "type": "text",
-                "text": {
-                    "content": link_text[:2000],
-                    "link": {"url": url}
-                }
-            })
-
-            # Account for any stripped punctuation - add it back as text
-            url_end_in_match = match.start() + len(raw_url)
-            last_end = url_end_in_match
+            last_end = end
 
-        # Add remaining text after last URL
+        # Add remaining text after last link
         if last_end < len(text):
             segments.extend(self._parse_formatted_text(text[last_end:]))
 
-        # If no URLs were found, just parse the whole text for formatting
-        if not segments:
-            return self._parse_formatted_text(text)
-
-        return segments
+        return segments if segments else [{"type": "text", "text": {"content": ""}}]
 
     def _parse_formatted_text(self, text: str) -> list:
         """Parse text for bold, italic, and code formatting."""
@@ -829,8 +1382,7 @@ class NotionBlockBuilder:
             return []
 
         segments = []
-        pattern = r'(\*\*[^*]+\*\*|__[^_]+__|(?<!\*)\*[^*]+\*(?!\*)|_[^_]+_|`[^`]+`)'
-        parts = re.split(pattern, text)
+        parts = self.FORMATTING_PATTERN.split(text)
 
         for part in parts:
             if not part:
@@ -866,35 +1418,40 @@ class NotionBlockBuilder:
         return segments
     
     def _paragraph_block(self, text: str) -> dict:
-        return {"object": "block", "type": "paragraph", "paragraph": {"rich_text": self._rich_text(text)}}
+        return _text_block("paragraph", self._rich_text(text))
     
     def _heading_block(self, text: str, level: int) -> dict:
-        heading_type = f"heading_{level}"
-        return {"object": "block", "type": heading_type, heading_type: {"rich_text": self._rich_text(text)}}
+        return _text_block(self.HEADING_TYPES[level - 1], self._rich_text(text))
     
     def _bullet_block(self, text: str) -> dict:
-        return {"object": "block", "type": "bulleted_list_item", "bulleted_list_item": {"rich_text": self._rich_text(text)}}
+        return _text_block("bulleted_list_item", self._rich_text(text))
     
     def _numbered_block(self, text: str) -> dict:
-        return {"object": "block", "type": "numbered_list_item", "numbered_list_item": {"rich_text": self._rich_text(text)}}
+        return _text_block("numbered_list_item", self._rich_text(text))
     
     def _quote_block(self, text: str) -> dict:
-        return {"object": "block", "type": "quote", "quote": {"rich_text": self._rich_text(text)}}
+        return _text_block("quote", self._rich_text(text))
     
     def _code_block(self, code: str, language: str) -> dict:
-        lang_map = {"js": "javascript", "ts": "typescript", "py": "python", "rb": "ruby", 
-                    "yml": "yaml", "sh": "shell", "bash": "shell", "zsh": "shell", "": "plain text"}
-        language = lang_map.get(language.lower(), language.lower())
-        return {"object": "block", "type": "code", "code": {"rich_text": [{"type": "text", "text": {"content": code[:2000]}}], "language": language}}
+        language = language.lower()
+        language = self.CODE_LANGUAGES.get(language, language)
+        # Long code is split across rich text items (2000 characters each, at most 100 per block)
+        limit = min(len(code), 2000 * 100)
+        if len(code) > limit:
+            logger.warning(f"Code block truncated to {limit} characters")
+        rich_text = [{"type": "text", "text": {"content": code[i:i + 2000]}} for i in range(0, limit, 2000)]
+        if not rich_text:
+            rich_text = [{"type": "text", "text": {"content": ""}}]
+        return _text_block("code", rich_text, language=language)
     
     def _divider_block(self) -> dict:
         return {"object": "block", "type": "divider", "divider": {}}
     
     def _todo_block(self, text: str, checked: bool) -> dict:
-        return {"object": "block", "type": "to_do", "to_do": {"rich_text": self._rich_text(text), "checked": checked}}
+        return _text_block("to_do", self._rich_text(text), checked=checked)
     
     def _callout_block(self, text: str, color: str = "gray_background") -> dict:
-        return {"object": "block", "type": "callout", "callout": {"rich_text": self._rich_text(text), "icon": {"type": "emoji", "emoji": "📎"}, "color": color}}
+        return _text_block("callout", self._rich_text(text), icon={"type": "emoji", "emoji": "📎"}, color=color)
     
     def _file_block(self, file_info: dict) -> dict:
         file_type = file_info.get("type", "file")
@@ -925,11 +1482,20 @@ class NotionBlockBuilder:
 
 class NotionMigrator:
     """Handles creating pages in Notion."""
+
+    # Pages whose blocks are added concurrently (still paced by the shared limiter)
+    BLOCK_WORKERS = 3
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, limiter: Optional[RateLimiter] = None):
         self.config = config
         self.client = NotionClient(auth=config.notion_token)
+        self.limiter = limiter or RateLimiter()
         self.created_pages = {}
+        self._pool = ThreadPoolExecutor(max_workers=self.BLOCK_WORKERS)
+
+    def shutdown(self):
+        """Wait for pending block appends and stop the worker threads."""
+        self._pool.shutdown(wait=True)
     
     def create_page(self, parent_id: str, title: str, icon: str = None) -> str:
         if self.config.dry_run:
@@ -947,6 +1513,7 @@ class NotionMigrator:
             page_data["icon"] = {"type": "emoji", "emoji": icon}
         
         try:
+            self.limiter.acquire()
             response = self.client.pages.create(**page_data)
             page_id = response["id"]
             self.created_pages[title] = page_id
@@ -956,6 +1523,12 @@ class NotionMigrator:
             logger.error(f"Failed to create page '{title}': {e}")
             raise
     
+    def submit_blocks(self, page_id: str, blocks: list) -> Future:
+        """Start adding blocks to a page in the background. The future resolves to add_blocks' result."""
+        if self.config.dry_run:
+            return _completed_future(self.add_blocks(page_id, blocks))
+        return self._pool.submit(self.add_blocks, page_id, blocks)
+
     def add_blocks(self, page_id: str, blocks: list, max_retries: int = 3) -> bool:
         """Add blocks to a page. Returns True on success, False on failure."""
         if self.config.dry_run:
@@ -972,6 +1545,7 @@ class NotionMigrator:
 
             for attempt in range(max_retries):
                 try:
+                    self.limiter.acquire()
                     self.client.blocks.children.append(block_id=page_id, children=batch)
                     success = True
                     break
@@ -995,9 +1569,6 @@ class NotionMigrator:
                 logger.error(f"Failed to add blocks after {max_retries} retries: {last_error}")
                 return False
 
-            if i + 100 < len(blocks):
-                time.sleep(0.3)
-
         logger.debug(f"Added {len(blocks)} blocks to page")
         return True
 
@@ -1034,10 +1605,15 @@ class MigrationOrchestrator:
         self.vault_path = config.vault_path
         self.report_prefix = report_prefix
 
-        self.notion = NotionMigrator(config)
-        self.parser = MarkdownParser(self.vault_path)
-        self.uploader = NotionFileUploader(config.notion_token, config)
-        self.block_builder = NotionBlockBuilder(self.uploader)
+        # One limiter paces all Notion traffic (page creation and file uploads)
+        self.limiter = RateLimiter()
+        self.notion = NotionMigrator(config, self.limiter)
+        self.cache = MigrationCache(CACHE_PATH) if config.use_cache else None
+        self.parser = MarkdownParser(self.vault_path, cache=self.cache)
+        self.uploader = NotionFileUploader(config.notion_token, config, max_workers=config.upload_workers,
+                                           limiter=self.limiter, cache=self.cache)
+        self.block_builder = NotionBlockBuilder(self.uploader,
+                                                cache=self.cache if config.use_title_cache else None)
 
         self.stats = {"directories": 0, "notes": 0, "files_referenced": 0, "files_orphaned": 0, "errors": 0, "api_errors": 0}
 
@@ -1050,6 +1626,7 @@ class MigrationOrchestrator:
         self.processed_notes = []  # Track markdown file processing results
         self.dir_page_ids = {}  # Map directory paths to their Notion page IDs
         self.api_errors = []  # Track API errors for reporting
+        self.pending_content = []  # (note_path, depth, processed note, future) for block appends in flight
 
     def run(self):
         logger.info("=" * 60)
@@ -1065,6 +1642,11 @@ class MigrationOrchestrator:
 
         # Step 1: Scan all files in the vault first
         self._scan_all_files()
+        self.parser.parse_files(self.all_markdown_files)
+        # Fetch link titles for all notes parsed so far in one concurrent batch
+        self.block_builder.prefetch_titles(
+            note.content for note in self.parser.parsed_notes(self.all_markdown_files)
+        )
 
         logger.info("-" * 60)
 
@@ -1076,6 +1658,8 @@ class MigrationOrchestrator:
         # Step 3: Upload orphaned files (files not referenced by any note)
         logger.info("-" * 60)
         self._upload_orphaned_files()
+        self.uploader.shutdown()
+        self.notion.shutdown()
 
         logger.info("=" * 60)
         logger.info("Migration Complete!")
@@ -1153,103 +1737,14 @@ class MigrationOrchestrator:
         """Write a CSV report of all file upload statuses."""
         csv_path = Path(f"{self.report_prefix}-files_report.csv")
 
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        # Rows come from a generator so writerows() handles the whole report in one call
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow([
                 'file_path', 'file_name', 'status', 'category', 'notion_page_id',
                 'notion_file_id', 'error_reason', 'referenced_from'
             ])
-
-            # Markdown notes
-            for item in self.processed_notes:
-                writer.writerow([
-                    item['file'],
-                    item['name'],
-                    item['status'],
-                    'markdown',
-                    item.get('page_id', ''),
-                    '',
-                    item.get('error', ''),
-                    ''
-                ])
-
-            # Successful uploads (referenced files)
-            for item in successful:
-                writer.writerow([
-                    item['file'],
-                    item['name'],
-                    'uploaded',
-                    'referenced',
-                    item.get('parent_page_id', ''),
-                    item.get('file_upload_id', ''),
-                    '',
-                    ''
-                ])
-
-            # Failed uploads (referenced files)
-            for item in failed:
-                writer.writerow([
-                    item['file'],
-                    item['name'],
-                    'upload_failed',
-                    'referenced',
-                    '',
-                    '',
-                    item.get('reason', 'Unknown'),
-                    ''
-                ])
-
-            # Orphaned files
-            for item in self.orphaned_files:
-                writer.writerow([
-                    item['file'],
-                    item['name'],
-                    item.get('status', 'unknown'),
-                    'orphaned',
-                    item.get('parent_page_id', ''),
-                    '',
-                    item.get('parent_dir', ''),
-                    ''
-                ])
-
-            # Skipped files (in .git, .trash, hidden files)
-            for item in self.skipped_files:
-                writer.writerow([
-                    item['file'],
-                    item['name'],
-                    'skipped',
-                    'skipped',
-                    '',
-                    '',
-                    item.get('reason', ''),
-                    ''
-                ])
-
-            # Unresolved references (referenced but file not found)
-            for item in unresolved:
-                writer.writerow([
-                    '',
-                    item['reference'],
-                    'not_found',
-                    'unresolved_reference',
-                    '',
-                    '',
-                    'File not found in vault',
-                    item.get('note', '')
-                ])
-
-            # API errors (transient failures like 502)
-            for item in self.api_errors:
-                writer.writerow([
-                    item.get('file', ''),
-                    item.get('name', ''),
-                    'api_error',
-                    item.get('type', 'unknown'),
-                    item.get('page_id', ''),
-                    '',
-                    item.get('reason', ''),
-                    ''
-                ])
+            writer.writerows(self._csv_report_rows(successful, failed, unresolved))
 
         # Calculate totals for verification
         total_files_in_vault = len(self.all_vault_files) + len(self.all_markdown_files) + len(self.skipped_files)
@@ -1272,10 +1767,98 @@ class MigrationOrchestrator:
         logger.info(f"Total files found in vault: {total_files_in_vault}")
         logger.info(f"Total files in report:      {total_in_report}")
 
-    def _should_skip_dir(self, dir_path: Path) -> bool:
-        """Check if a directory should be skipped entirely (not migrated)."""
-        name = dir_path.name.lower()
-        return name.startswith('.') or name in self.SKIP_DIRS_REPORT
+    def _csv_report_rows(self, successful: list, failed: list, unresolved: list):
+        """Yield the CSV report's rows, one section after another."""
+        # Markdown notes
+        for item in self.processed_notes:
+            yield [
+                item['file'],
+                item['name'],
+                item['status'],
+                'markdown',
+                item.get('page_id', ''),
+                '',
+                item.get('error', ''),
+                ''
+            ]
+
+        # Successful uploads (referenced files)
+        for item in successful:
+            yield [
+                item['file'],
+                item['name'],
+                'uploaded',
+                'referenced',
+                item.get('parent_page_id', ''),
+                item.get('file_upload_id', ''),
+                '',
+                ''
+            ]
+
+        # Failed uploads (referenced files)
+        for item in failed:
+            yield [
+                item['file'],
+                item['name'],
+                'upload_failed',
+                'referenced',
+                '',
+                '',
+                item.get('reason', 'Unknown'),
+                ''
+            ]
+
+        # Orphaned files
+        for item in self.orphaned_files:
+            yield [
+                item['file'],
+                item['name'],
+                item.get('status', 'unknown'),
+                'orphaned',
+                item.get('parent_page_id', ''),
+                '',
+                item.get('parent_dir', ''),
+                ''
+            ]
+
+        # Skipped files (in .git, .trash, hidden files)
+        for item in self.skipped_files:
+            yield [
+                item['file'],
+                item['name'],
+                'skipped',
+                'skipped',
+                '',
+                '',
+                item.get('reason', ''),
+                ''
+            ]
+
+        # Unresolved references (referenced but file not found)
+        for item in unresolved:
+            yield [
+                '',
+                item['reference'],
+                'not_found',
+                'unresolved_reference',
+                '',
+                '',
+                'File not found in vault',
+                item.get('note', '')
+            ]
+
+        # API errors (transient failures like 502)
+        for item in self.api_errors:
+            yield [
+                item.get('file', ''),
+                item.get('name', ''),
+                'api_error',
+                item.get('type', 'unknown'),
+                item.get('page_id', ''),
+                '',
+                item.get('reason', ''),
+                ''
+            ]
 
     def _is_attachment_dir(self, dir_path: Path) -> bool:
         """Check if a directory is an attachment folder (files processed but no page created)."""
@@ -1333,12 +1916,21 @@ class MigrationOrchestrator:
 
     def _migrate_directory_contents(self, dir_path: Path, parent_id: str, depth: int):
         """Recursively migrate a directory's contents."""
-        # Get all subdirectories and markdown files
-        subdirs = sorted(
-            [d for d in dir_path.iterdir() if d.is_dir() and not self._should_skip_dir(d)],
-            reverse=self.config.reverse_sort
-        )
-        md_files = sorted(dir_path.glob("*.md"), reverse=self.config.reverse_sort)
+        # Get all subdirectories and markdown files in one pass over a single directory read
+        subdirs = []
+        md_files = []
+        skip_dirs = self.SKIP_DIRS_REPORT
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir():
+                    # Hidden and skipped directories aren't migrated
+                    if not (name.startswith('.') or name.lower() in skip_dirs):
+                        subdirs.append(Path(entry.path))
+                elif name.endswith('.md'):
+                    md_files.append(Path(entry.path))
+        subdirs.sort(reverse=self.config.reverse_sort)
+        md_files.sort(reverse=self.config.reverse_sort)
 
         # Migrate subdirectories first (they become subpages)
         for subdir in subdirs:
@@ -1348,6 +1940,9 @@ class MigrationOrchestrator:
         for md_file in md_files:
             self._migrate_note(md_file, parent_id, depth)
 
+        # Wait for this directory's notes to finish adding their content
+        self._finish_pending_content()
+
     def _migrate_directory(self, dir_path: Path, parent_id: str, depth: int):
         """Migrate a directory as a Notion page with its contents as children."""
         logger.info(f"{'  ' * depth}📁 {dir_path.name}/")
@@ -1384,28 +1979,20 @@ class MigrationOrchestrator:
 
             self.stats["files_referenced"] += len(parsed.file_references)
 
-            content_failed = False
-            if blocks:
-                if not self.notion.add_blocks(note_page_id, blocks):
-                    logger.warning(f"{'  ' * depth}⚠️  Content partially failed for: {note_path.name}")
-                    self.api_errors.append({
-                        'type': 'note_content',
-                        'file': str(note_path),
-                        'name': note_path.name,
-                        'page_id': note_page_id,
-                        'reason': 'Failed to add blocks after retries'
-                    })
-                    self.stats["api_errors"] += 1
-                    content_failed = True
-
-            # Track this note's processing result
-            self.processed_notes.append({
+            # Track this note's processing result (status is updated if adding content fails)
+            processed_note = {
                 'file': str(note_path),
                 'name': note_path.name,
-                'status': 'content_failed' if content_failed else 'migrated',
+                'status': 'migrated',
                 'page_id': note_page_id,
                 'page_title': page_title
-            })
+            }
+            self.processed_notes.append(processed_note)
+
+            # Content is added in the background while the next notes are built
+            if blocks:
+                future = self.notion.submit_blocks(note_page_id, blocks)
+                self.pending_content.append((note_path, depth, processed_note, future))
 
             self.stats["notes"] += 1
 
@@ -1424,11 +2011,30 @@ class MigrationOrchestrator:
                 import traceback
                 traceback.print_exc()
 
+    def _finish_pending_content(self):
+        """Wait for in-flight block appends and record notes whose content failed."""
+        for note_path, depth, processed_note, future in self.pending_content:
+            if future.result():
+                continue
+            logger.warning(f"{'  ' * depth}⚠️  Content partially failed for: {note_path.name}")
+            self.api_errors.append({
+                'type': 'note_content',
+                'file': str(note_path),
+                'name': note_path.name,
+                'page_id': processed_note['page_id'],
+                'reason': 'Failed to add blocks after retries'
+            })
+            self.stats["api_errors"] += 1
+            processed_note['status'] = 'content_failed'
+        self.pending_content.clear()
+
     def _upload_orphaned_files(self):
         """Upload files that weren't referenced by any markdown note."""
         logger.info("Processing orphaned files...")
 
+        # Start all orphan uploads first so they run concurrently
         orphan_count = 0
+        pending = []
         for file_path in self.all_vault_files:
             resolved_path = str(file_path.resolve())
 
@@ -1459,7 +2065,10 @@ class MigrationOrchestrator:
 
             # Upload the file
             logger.info(f"  📎 Orphan: {file_path.name} -> {parent_dir.name}/")
-            file_info = self.uploader.upload_file(file_path, parent_page_id)
+            pending.append((file_path, parent_page_id, self.uploader.submit_upload(file_path, parent_page_id)))
+
+        for file_path, parent_page_id, file_future in pending:
+            file_info = file_future.result()
 
             if file_info and file_info.get("file_upload_id"):
                 # Create a file block in the parent page
@@ -1548,7 +2157,10 @@ def main():
         dry_run=args.dry_run,
         skip_files=args.skip_files,
         verbose=args.verbose,
-        reverse_sort=args.reverse_sort
+        reverse_sort=args.reverse_sort,
+        use_cache=not args.no_cache,
+        use_title_cache=not args.no_title_cache,
+        upload_workers=max(1, args.upload_workers)
     )
 
     orchestrator = MigrationOrchestrator(config, log_prefix)
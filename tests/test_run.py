@@ -0,0 +1,95 @@
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import run  # noqa: E402
+
+
+def _exists_ignoring_case(path: Path) -> bool:
+    """Path.exists() as a case-insensitive filesystem (macOS, Windows) answers it."""
+    parent = path.parent
+    if not parent.is_dir():
+        return False
+    name = path.name.lower()
+    return any(entry.name.lower() == name for entry in parent.iterdir())
+
+
+class ResolveFileReferenceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.vault = Path(self.tmp.name)
+        (self.vault / "files").mkdir()
+        (self.vault / "files" / "image.png").write_bytes(b"png")
+        self.note = self.vault / "Note.md"
+        self.note.write_text("![[Image.PNG]]\n", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ref_differing_only_in_case_resolves_on_case_insensitive_fs(self):
+        parser = run.MarkdownParser(self.vault)
+        with mock.patch.object(Path, "exists", _exists_ignoring_case):
+            parsed = parser.parse_file(self.note)
+
+        self.assertEqual(parser.unresolved_references, [])
+        self.assertEqual(len(parsed.file_references), 1)
+        self.assertEqual(parsed.file_references[0][1].name.lower(), "image.png")
+
+
+class ParallelParseLoggingTest(unittest.TestCase):
+    def test_worker_messages_are_logged_by_the_main_process(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            vault = Path(tmp)
+            notes = []
+            for i in range(3):
+                note = vault / f"n{i}.md"
+                note.write_text(f"![[missing{i}.png]]\n", encoding="utf-8")
+                notes.append(note)
+
+            parser = run.MarkdownParser(vault)
+            parser.PARALLEL_PARSE_MIN_NOTES = 1
+            with self.assertLogs(run.logger, level="WARNING") as logs:
+                parser.parse_files(notes)
+                self.assertEqual(len(parser._prepared), 3)
+                for note in notes:
+                    parser.parse_file(note)
+
+        self.assertEqual(
+            [line for line in logs.output if "Could not resolve" in line],
+            [f"WARNING:run:Could not resolve file reference: missing{i}.png" for i in range(3)],
+        )
+        self.assertEqual(len(parser.unresolved_references), 3)
+
+
+class MimeTypeTest(unittest.TestCase):
+    def test_matches_guess_from_the_whole_file_name(self):
+        uploader = run.NotionFileUploader("token", None)
+        self.addCleanup(uploader.shutdown)
+        for name in ("x.gz", "a.tar.gz", "b.png.gz", "c.PNG", "n.Gz", "k.TAR.GZ", "d.docx", "f"):
+            with self.subTest(name=name):
+                expected = run.mimetypes.guess_type(name)[0] or "application/octet-stream"
+                self.assertEqual(uploader._mime_type(Path("/vault") / name), expected)
+
+
+class BracketSoupTimingTest(unittest.TestCase):
+    def test_unclosed_brackets_build_in_linear_time(self):
+        builder = run.NotionBlockBuilder(None)
+        for soup in ("[[", "[[a|", "[a]("):
+            with self.subTest(soup=soup):
+                note = run.ParsedNote(title="soup", content=soup * 20000)
+
+                start = time.perf_counter()
+                blocks = builder.build_blocks(note, Path("."))
+                elapsed = time.perf_counter() - start
+
+                self.assertEqual(len(blocks), 1)
+                self.assertLess(elapsed, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()